@@ -6,12 +6,20 @@ from typing import List
 from .schemas import ResponseItem, ReviewBundle, FirstOpinion
 
 
+def _query_prefix(query: str) -> str:
+    # Stage 1 and stage 2 prompts both start with this block so Ollama can reuse
+    # the cached prefix from an agent's first opinion when it reviews. Nothing
+    # agent-specific may go here, or stage 2 would no longer be anonymous.
+    return f"Query:\n{query}\n\n"
+
+
 def build_first_opinion_prompt(query: str, context: str | None) -> str:
-    context_block = f"\nContext:\n{context}" if context else ""
+    context_block = f"Context:\n{context}\n\n" if context else ""
     return (
+        f"{_query_prefix(query)}{context_block}"
         "You are a Council member. Provide a concise, accurate answer. "
         "If unsure, say so briefly.\n\n"
-        f"Query:\n{query}{context_block}\n\nAnswer:"
+        "Answer:"
     )
 
 
@@ -19,12 +27,12 @@ def build_review_prompt(query: str, responses: List[ResponseItem], rubric: str)
     response_lines = [f"{item.response_id}: {item.answer}" for item in responses]
     response_block = "\n".join(response_lines)
     return (
+        f"{_query_prefix(query)}"
         "You are a strict evaluator. Rank the responses by accuracy and insight. "
         "Return ONLY valid JSON with a top-level key 'rankings'. "
         "Each ranking item must have response_id, rank (1 is best), and rationale. "
         "No extra keys, no prose.\n\n"
         f"Rubric:\n{rubric}\n\n"
-        f"Query:\n{query}\n\n"
         f"Responses:\n{response_block}\n\n"
         "Return JSON now."
     )